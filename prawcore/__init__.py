@@ -13,8 +13,28 @@ from .auth import (  # noqa
     UntrustedAuthenticator,
 )
 from .const import __version__  # noqa
-from .exceptions import *  # noqa
+from .exceptions import (  # noqa
+    BadJSON,
+    BadRequest,
+    Conflict,
+    Forbidden,
+    InsufficientScope,
+    InvalidInvocation,
+    InvalidToken,
+    NotFound,
+    OAuthException,
+    PrawcoreException,
+    Redirect,
+    RequestException,
+    ResponseException,
+    ServerError,
+    SpecialError,
+    TooLarge,
+    TooManyRequests,
+    UnavailableForLegalReasons,
+    URITooLong,
+)
 from .requestor import Requestor  # noqa
 from .sessions import Session, session  # noqa
 
-logging.getLogger(__package__).addHandler(logging.NullHandler())
+logging.getLogger("prawcore").addHandler(logging.NullHandler())
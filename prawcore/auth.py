@@ -1,4 +1,5 @@
 """Provides Authentication and Authorization classes."""
+import threading
 import time
 from typing import Any, Dict, Optional
 
@@ -12,6 +13,29 @@ from requests.status_codes import codes
 from . import const
 from .exceptions import InvalidInvocation, OAuthException, ResponseException
 
+# Access tokens shared between authorizers that request them with identical
+# credentials. Maps a token cache key to ``(payload, monotonic_expiration)``.
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+# Cached tokens are not handed out once they are this close to expiring.
+_TOKEN_CACHE_MARGIN = 30
+
+
+def _purge_expired_tokens():
+    """Remove cached tokens too close to expiring to be handed out.
+
+    Must be called while holding ``_TOKEN_CACHE_LOCK``.
+
+    """
+    now = time.monotonic()
+    expired = [
+        cache_key
+        for cache_key, (_, expiration) in _TOKEN_CACHE.items()
+        if expiration - now <= _TOKEN_CACHE_MARGIN
+    ]
+    for cache_key in expired:
+        del _TOKEN_CACHE[cache_key]
+
 
 class BaseAuthenticator(object):
     """Provide the base authenticator object that stores OAuth2 credentials."""
@@ -148,15 +172,21 @@ class BaseAuthorizer(object):
         self._validate_authenticator()
 
     def _clear_access_token(self):
+        self._cached_token = None
         self._expiration_timestamp = None
         self.access_token = None
         self.scopes = None
 
     def _request_token(self, **data):
+        cache_key = self._token_cache_key_for(data)
+        if cache_key is not None and self._use_cached_token(cache_key):
+            return
+
         url = (
             self._authenticator._requestor.reddit_url + const.ACCESS_TOKEN_PATH
         )
         pre_request_time = time.time()
+        pre_request_monotonic = time.monotonic()
         response = self._authenticator._post(url, **data)
         payload = response.json()
         if "error" in payload:  # Why are these OKAY responses?
@@ -164,14 +194,44 @@ class BaseAuthorizer(object):
                 response, payload["error"], payload.get("error_description")
             )
 
-        self._expiration_timestamp = (
-            pre_request_time - 10 + payload["expires_in"]
-        )
+        self._set_token(payload, pre_request_time - 10 + payload["expires_in"])
+        if cache_key is not None:
+            expiration = pre_request_monotonic + payload["expires_in"]
+            with _TOKEN_CACHE_LOCK:
+                _purge_expired_tokens()
+                _TOKEN_CACHE[cache_key] = (payload, expiration)
+            self._cached_token = (cache_key, payload["access_token"])
+
+    def _set_token(self, payload, expiration_timestamp):
+        self._expiration_timestamp = expiration_timestamp
         self.access_token = payload["access_token"]
         if "refresh_token" in payload:
             self.refresh_token = payload["refresh_token"]
         self.scopes = set(payload["scope"].split(" "))
 
+    def _token_cache_key_for(self, data):
+        if data.get("grant_type") == "authorization_code" or "otp" in data:
+            return None  # Authorization codes and OTPs are single use.
+        return (
+            self._authenticator._requestor.reddit_url,
+            self._authenticator._auth(),
+            tuple(sorted(data.items())),
+        )
+
+    def _use_cached_token(self, cache_key):
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(cache_key)
+            if cached is None:
+                return False
+            payload, expiration = cached
+            remaining = expiration - time.monotonic()
+            if remaining <= _TOKEN_CACHE_MARGIN:
+                del _TOKEN_CACHE[cache_key]
+                return False
+        self._set_token(payload, time.time() - 10 + remaining)
+        self._cached_token = (cache_key, payload["access_token"])
+        return True
+
     def _validate_authenticator(self):
         if not isinstance(self._authenticator, self.AUTHENTICATOR_CLASS):
             raise InvalidInvocation(
@@ -179,6 +239,25 @@ class BaseAuthorizer(object):
                 f" {self.AUTHENTICATOR_CLASS.__name__}."
             )
 
+    def invalidate(self):
+        """Discard the current access token so that the next use obtains a new one.
+
+        The token is also evicted from the process-wide token cache, ensuring that no
+        other authorizer with the same credentials is handed it. A newer token cached
+        by another authorizer in the meantime is left in place.
+
+        """
+        if self._cached_token is not None:
+            cache_key, access_token = self._cached_token
+            with _TOKEN_CACHE_LOCK:
+                cached = _TOKEN_CACHE.get(cache_key)
+                if (
+                    cached is not None
+                    and cached[0]["access_token"] == access_token
+                ):
+                    del _TOKEN_CACHE[cache_key]
+        self._clear_access_token()
+
     def is_valid(self):
         """Return whether or not the Authorizer is ready to authorize requests.
 
@@ -197,7 +276,7 @@ class BaseAuthorizer(object):
             raise InvalidInvocation("no token available to revoke")
 
         self._authenticator.revoke_token(self.access_token, "access_token")
-        self._clear_access_token()
+        self.invalidate()
 
 
 class Authorizer(BaseAuthorizer):
@@ -278,7 +357,7 @@ class Authorizer(BaseAuthorizer):
             self._authenticator.revoke_token(
                 self.refresh_token, "refresh_token"
             )
-            self._clear_access_token()
+            self.invalidate()
             self.refresh_token = None
 
 
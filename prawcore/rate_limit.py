@@ -2,7 +2,7 @@
 import logging
 import time
 
-log = logging.getLogger(__package__)
+log = logging.getLogger("prawcore")
 
 
 class RateLimiter(object):
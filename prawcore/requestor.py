@@ -1,5 +1,6 @@
 """Provides the HTTP request handling interface."""
 import requests
+from requests.adapters import HTTPAdapter
 
 from .const import TIMEOUT, __version__
 from .exceptions import InvalidInvocation, RequestException
@@ -39,7 +40,15 @@ class Requestor(object):
         if user_agent is None or len(user_agent) < 7:
             raise InvalidInvocation("user_agent is not descriptive")
 
-        self._http = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            # Keep warm keep-alive connections to both the oauth and www hosts.
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=32, pool_block=False
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self._http = session
         self._http.headers[
             "User-Agent"
         ] = f"{user_agent} prawcore/{__version__}"
@@ -49,7 +58,7 @@ class Requestor(object):
         self.timeout = timeout
 
     def close(self):
-        """Call close on the underlying session."""
+        """Call close on the underlying session, releasing pooled connections."""
         return self._http.close()
 
     def request(self, *args, timeout=None, **kwargs):
@@ -33,7 +33,7 @@ from .exceptions import (
 from .rate_limit import RateLimiter
 from .util import authorization_error_class
 
-log = logging.getLogger(__package__)
+log = logging.getLogger("prawcore")
 
 
 class RetryStrategy(object):
@@ -242,7 +242,7 @@ class Session(object):
             response is not None
             and response.status_code == codes["unauthorized"]
         ):
-            self._authorizer._clear_access_token()
+            self._authorizer.invalidate()
             if hasattr(self._authorizer, "refresh"):
                 do_retry = True
 
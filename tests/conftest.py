@@ -3,11 +3,13 @@
 import os
 from base64 import b64encode
 
+import pytest
 from betamax import Betamax
 from betamax_matchers.json_body import JSONBodyMatcher
 from betamax_serializers import pretty_json
 
 from prawcore import Requestor
+from prawcore.auth import _TOKEN_CACHE
 
 CLIENT_ID = os.environ.get("PRAWCORE_CLIENT_ID", "fake_client_id")
 CLIENT_SECRET = os.environ.get("PRAWCORE_CLIENT_SECRET", "fake_client_secret")
@@ -26,6 +28,14 @@ USERNAME = os.environ.get("PRAWCORE_USERNAME", "fake_username")
 REQUESTOR = Requestor("prawcore:test (by /u/bboe)")
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Prevent access tokens cached by one test from leaking into another."""
+    _TOKEN_CACHE.clear()
+    yield
+    _TOKEN_CACHE.clear()
+
+
 def b64_string(input_string):
     """Return a base64 encoded string (not bytes) from input_string."""
     return b64encode(input_string.encode("utf-8")).decode("utf-8")
@@ -2,6 +2,7 @@
 import unittest
 
 from betamax import Betamax
+from mock import Mock, patch
 
 import prawcore
 
@@ -19,6 +20,15 @@ from .conftest import (  # noqa F401
 )
 
 
+def token_response(access_token, expires_in=3600):
+    payload = {
+        "access_token": access_token,
+        "expires_in": expires_in,
+        "scope": "*",
+    }
+    return Mock(json=lambda: payload)
+
+
 class AuthorizerTestBase(unittest.TestCase):
     def setUp(self):
         self.authentication = prawcore.TrustedAuthenticator(
@@ -97,6 +107,45 @@ class AuthorizerTest(AuthorizerTestBase):
         self.assertIsNone(authorizer.refresh_token)
         self.assertFalse(authorizer.is_valid())
 
+    def test_invalidate(self):
+        authorizer = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        with Betamax(REQUESTOR).use_cassette("Authorizer_refresh"):
+            authorizer.refresh()
+        self.assertEqual(1, len(prawcore.auth._TOKEN_CACHE))
+
+        authorizer.invalidate()
+        self.assertIsNone(authorizer.access_token)
+        self.assertIsNone(authorizer.scopes)
+        self.assertIsNotNone(authorizer.refresh_token)
+        self.assertFalse(authorizer.is_valid())
+        self.assertEqual({}, prawcore.auth._TOKEN_CACHE)
+
+    def test_invalidate__keeps_newer_cached_token(self):
+        stale = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        fresh = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        with patch.object(
+            self.authentication,
+            "_post",
+            side_effect=[token_response("old"), token_response("new")],
+        ):
+            stale.refresh()
+            fresh.refresh()
+            fresh.invalidate()
+            fresh.refresh()
+        self.assertEqual("old", stale.access_token)
+        self.assertEqual("new", fresh.access_token)
+
+        stale.invalidate()
+        self.assertIsNone(stale.access_token)
+        ((payload, _),) = prawcore.auth._TOKEN_CACHE.values()
+        self.assertEqual("new", payload["access_token"])
+
     def test_refresh(self):
         authorizer = prawcore.Authorizer(
             self.authentication, refresh_token=REFRESH_TOKEN
@@ -144,6 +193,44 @@ class AuthorizerTest(AuthorizerTestBase):
         self.assertTrue(len(authorizer.scopes) > 0)
         self.assertTrue(authorizer.is_valid())
 
+    def test_refresh__reuses_cached_token(self):
+        authorizer = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        other = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        with Betamax(REQUESTOR).use_cassette("Authorizer_refresh"):
+            authorizer.refresh()
+            other.refresh()
+
+        self.assertEqual(authorizer.access_token, other.access_token)
+        self.assertEqual(authorizer.scopes, other.scopes)
+        self.assertTrue(other.is_valid())
+
+    def test_refresh__skips_cached_token_within_margin(self):
+        authorizer = prawcore.Authorizer(
+            self.authentication, refresh_token=REFRESH_TOKEN
+        )
+        with patch.object(
+            self.authentication,
+            "_post",
+            side_effect=[token_response("first"), token_response("second")],
+        ) as post, patch("prawcore.auth.time.monotonic") as monotonic:
+            monotonic.return_value = 1000
+            authorizer.refresh()
+
+            # The token expires at 4600; with 31 seconds left it is reused.
+            monotonic.return_value = 4569
+            authorizer.refresh()
+            self.assertEqual("first", authorizer.access_token)
+            self.assertEqual(1, post.call_count)
+
+            monotonic.return_value = 4570
+            authorizer.refresh()
+            self.assertEqual("second", authorizer.access_token)
+            self.assertEqual(2, post.call_count)
+
     def test_refresh__with_invalid_token(self):
         authorizer = prawcore.Authorizer(
             self.authentication, refresh_token="INVALID_TOKEN"
@@ -431,3 +518,17 @@ class ScriptAuthorizerTest(AuthorizerTestBase):
         self.assertIsNotNone(authorizer.access_token)
         self.assertEqual(set(["*"]), authorizer.scopes)
         self.assertTrue(authorizer.is_valid())
+
+    def test_refresh__with_otp__not_cached(self):
+        authorizer = prawcore.ScriptAuthorizer(
+            self.authentication,
+            USERNAME,
+            PASSWORD,
+            two_factor_callback=lambda: "123456",
+        )
+        with patch.object(
+            self.authentication, "_post", return_value=token_response("otp")
+        ):
+            authorizer.refresh()
+        self.assertEqual("otp", authorizer.access_token)
+        self.assertEqual({}, prawcore.auth._TOKEN_CACHE)
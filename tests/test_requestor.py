@@ -10,6 +10,13 @@ from prawcore import RequestException
 
 
 class RequestorTest(unittest.TestCase):
+    def test_close(self):
+        session = Mock(headers={})
+        prawcore.Requestor(
+            "prawcore:test (by /u/bboe)", session=session
+        ).close()
+        session.close.assert_called_once_with()
+
     def test_initialize(self):
         requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
         self.assertEqual(
@@ -17,6 +24,13 @@ class RequestorTest(unittest.TestCase):
             requestor._http.headers["User-Agent"],
         )
 
+    def test_initialize__mounts_pooled_adapter(self):
+        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
+        for prefix in ("http://", "https://"):
+            adapter = requestor._http.get_adapter(prefix + "oauth.reddit.com")
+            self.assertEqual(32, adapter._pool_maxsize)
+            self.assertFalse(adapter._pool_block)
+
     def test_initialize__failures(self):
         for agent in [None, "shorty"]:
             self.assertRaises(
@@ -1,6 +1,10 @@
 """Test for prawcore.Sessions module."""
 import logging
 import unittest
+from contextlib import contextmanager
+from copy import copy
+from functools import lru_cache
+from io import BytesIO
 from json import dumps
 
 from betamax import Betamax
@@ -25,6 +29,34 @@ from .conftest import (
     two_factor_callback,
 )
 
+_CHUNKED_EXPECTED = (
+    "prawcore",
+    "WARNING",
+    "Retrying due to ChunkedEncodingError() status: GET "
+    "https://oauth.reddit.com/",
+)
+_CONN_EXPECTED = (
+    "prawcore",
+    "WARNING",
+    "Retrying due to ConnectionError() status: GET https://oauth.reddit.com/",
+)
+_TIMEOUT_EXPECTED = (
+    "prawcore",
+    "WARNING",
+    "Retrying due to ReadTimeout() status: GET https://oauth.reddit.com/",
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(
+            (record.name, record.levelname, record.getMessage())
+        )
+
 
 class InvalidAuthorizer(prawcore.Authorizer):
     def __init__(self):
@@ -47,9 +79,9 @@ def client_authorizer():
     return authorizer
 
 
-def readonly_authorizer(refresh=True, requestor=REQUESTOR):
+def readonly_authorizer(refresh=True):
     authenticator = prawcore.TrustedAuthenticator(
-        requestor, CLIENT_ID, CLIENT_SECRET
+        REQUESTOR, CLIENT_ID, CLIENT_SECRET
     )
     authorizer = prawcore.ReadOnlyAuthorizer(authenticator)
     if refresh:
@@ -68,7 +100,70 @@ def script_authorizer():
     return authorizer
 
 
+@lru_cache(maxsize=None)
+def file_contents(filename):
+    with open(f"tests/files/{filename}", "rb") as fp:
+        return fp.read()
+
+
+def upload_file(filename):
+    return filename, BytesIO(file_contents(filename))
+
+
+@contextmanager
+def user_agent(requestor, agent):
+    headers = requestor._http.headers
+    original = headers["User-Agent"]
+    headers["User-Agent"] = agent
+    try:
+        yield
+    finally:
+        headers["User-Agent"] = original
+
+
 class SessionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Each flavor's token is obtained once, from a dedicated cassette, so that
+        # no test's cassette depends on which test happened to run first.
+        with Betamax(REQUESTOR).use_cassette("Session_authorizers"):
+            cls._authorizers = {
+                "client": client_authorizer(),
+                "readonly": readonly_authorizer(),
+                "script": script_authorizer(),
+            }
+
+    def authorizer(self, flavor):
+        return copy(self._authorizers[flavor])
+
+    def _assert_retry(self, exception, expected):
+        with patch.object(REQUESTOR._http, "request") as mock_request:
+            # Handle Auth
+            response_dict = {"access_token": "", "expires_in": 99, "scope": ""}
+            mock_request.return_value = Mock(
+                headers={}, json=lambda: response_dict, status_code=200
+            )
+            authorizer = readonly_authorizer()
+            mock_request.reset_mock()
+
+            # Fail on subsequent request
+            mock_request.side_effect = exception
+
+            handler = _ListHandler(level=logging.WARNING)
+            logger = logging.getLogger("prawcore")
+            logger.addHandler(handler)
+            try:
+                with self.assertRaises(RequestException) as context_manager:
+                    prawcore.Session(authorizer).request("GET", "/")
+            finally:
+                logger.removeHandler(handler)
+            self.assertEqual([expected, expected], handler.records)
+            self.assertIsInstance(context_manager.exception, RequestException)
+            self.assertIs(
+                exception, context_manager.exception.original_exception
+            )
+            self.assertEqual(3, mock_request.call_count)
+
     def test_close(self):
         prawcore.Session(readonly_authorizer(refresh=False)).close()
 
@@ -91,80 +186,24 @@ class SessionTest(unittest.TestCase):
 
     def test_request__accepted(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__accepted"):
-            session = prawcore.Session(script_authorizer())
-            with LogCapture(level=logging.DEBUG) as log_capture:
+            session = prawcore.Session(self.authorizer("script"))
+            with LogCapture(
+                level=logging.DEBUG, names=("prawcore",)
+            ) as log_capture:
                 session.request("POST", "api/read_all_messages")
             log_capture.check_present(
                 ("prawcore", "DEBUG", "Response: 202 (2 bytes)")
             )
 
-    @patch("requests.Session")
-    def test_request__chunked_encoding_retry(self, mock_session):
-        session_instance = mock_session.return_value
+    def test_request__chunked_encoding_retry(self):
+        self._assert_retry(ChunkedEncodingError(), _CHUNKED_EXPECTED)
 
-        # Handle Auth
-        response_dict = {"access_token": "", "expires_in": 99, "scope": ""}
-        session_instance.request.return_value = Mock(
-            headers={}, json=lambda: response_dict, status_code=200
-        )
-        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
-        authorizer = readonly_authorizer(requestor=requestor)
-        session_instance.request.reset_mock()
-
-        # Fail on subsequent request
-        exception = ChunkedEncodingError()
-        session_instance.request.side_effect = exception
-
-        expected = (
-            "prawcore",
-            "WARNING",
-            "Retrying due to ChunkedEncodingError() status: GET "
-            "https://oauth.reddit.com/",
-        )
-
-        with LogCapture(level=logging.WARNING) as log_capture:
-            with self.assertRaises(RequestException) as context_manager:
-                prawcore.Session(authorizer).request("GET", "/")
-            log_capture.check(expected, expected)
-        self.assertIsInstance(context_manager.exception, RequestException)
-        self.assertIs(exception, context_manager.exception.original_exception)
-        self.assertEqual(3, session_instance.request.call_count)
-
-    @patch("requests.Session")
-    def test_request__connection_error_retry(self, mock_session):
-        session_instance = mock_session.return_value
-
-        # Handle Auth
-        response_dict = {"access_token": "", "expires_in": 99, "scope": ""}
-        session_instance.request.return_value = Mock(
-            headers={}, json=lambda: response_dict, status_code=200
-        )
-        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
-        authorizer = readonly_authorizer(requestor=requestor)
-        session_instance.request.reset_mock()
-
-        # Fail on subsequent request
-        exception = ConnectionError()
-        session_instance.request.side_effect = exception
-
-        expected = (
-            "prawcore",
-            "WARNING",
-            "Retrying due to ConnectionError() status: GET "
-            "https://oauth.reddit.com/",
-        )
-
-        with LogCapture(level=logging.WARNING) as log_capture:
-            with self.assertRaises(RequestException) as context_manager:
-                prawcore.Session(authorizer).request("GET", "/")
-            log_capture.check(expected, expected)
-        self.assertIsInstance(context_manager.exception, RequestException)
-        self.assertIs(exception, context_manager.exception.original_exception)
-        self.assertEqual(3, session_instance.request.call_count)
+    def test_request__connection_error_retry(self):
+        self._assert_retry(ConnectionError(), _CONN_EXPECTED)
 
     def test_request__get(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__get"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             params = {"limit": 100}
             response = session.request("GET", "/", params=params)
         self.assertIsInstance(response, dict)
@@ -176,7 +215,7 @@ class SessionTest(unittest.TestCase):
             "Session_request__patch",
             match_requests_on=["method", "uri", "json-body"],
         ):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             json = {"lang": "ja", "num_comments": 123}
             response = session.request("PATCH", "/api/v1/me/prefs", json=json)
             self.assertEqual("ja", response["lang"])
@@ -184,7 +223,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__post(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__post"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             data = {
                 "kind": "self",
                 "sr": "reddit_api_test",
@@ -203,21 +242,20 @@ class SessionTest(unittest.TestCase):
             "Session_request__post__with_files",
             match_requests_on=["uri", "method"],
         ):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             data = {"upload_type": "header"}
-            with open("tests/files/white-square.png", "rb") as fp:
-                files = {"file": fp}
-                response = session.request(
-                    "POST",
-                    "/r/reddit_api_test/api/upload_sr_img",
-                    data=data,
-                    files=files,
-                )
+            files = {"file": upload_file("white-square.png")}
+            response = session.request(
+                "POST",
+                "/r/reddit_api_test/api/upload_sr_img",
+                data=data,
+                files=files,
+            )
             self.assertIn("img_src", response)
 
     def test_request__raw_json(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__raw_json"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             response = session.request(
                 "GET",
                 "/r/reddit_api_test/comments/45xjdr/want_raw_json_test/",
@@ -229,7 +267,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__bad_gateway(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__bad_gateway"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
             self.assertEqual(
@@ -238,7 +276,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__bad_json(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__bad_json"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             with self.assertRaises(prawcore.BadJSON) as context_manager:
                 session.request("GET", "/")
             self.assertEqual(
@@ -247,7 +285,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__bad_request(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__bad_request"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             with self.assertRaises(prawcore.BadRequest) as context_manager:
                 session.request(
                     "PUT",
@@ -260,7 +298,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__cloudflare_connection_timed_out"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
                 session.request("GET", "/")
@@ -273,7 +311,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__cloudflare_unknown_error"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
                 session.request("GET", "/")
@@ -284,7 +322,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__conflict(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__conflict"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             previous = "f0214574-430d-11e7-84ca-1201093304fa"
             with self.assertRaises(prawcore.Conflict) as context_manager:
                 session.request(
@@ -302,7 +340,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__created(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__created"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             response = session.request(
                 "PUT", "/api/v1/me/friends/spez", data="{}"
             )
@@ -310,7 +348,7 @@ class SessionTest(unittest.TestCase):
 
     def test_request__forbidden(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__forbidden"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             self.assertRaises(
                 prawcore.Forbidden,
                 session.request,
@@ -322,7 +360,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__gateway_timeout"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
             self.assertEqual(
@@ -333,7 +371,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__internal_server_error"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
             self.assertEqual(
@@ -342,13 +380,13 @@ class SessionTest(unittest.TestCase):
 
     def test_request__no_content(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__no_content"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             response = session.request("DELETE", "/api/v1/me/friends/spez")
             self.assertIsNone(response)
 
     def test_request__not_found(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__not_found"):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             self.assertRaises(
                 prawcore.NotFound,
                 session.request,
@@ -360,54 +398,25 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__okay_with_0_byte_content"
         ):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             data = {"model": dumps({"name": "redditdev"})}
             path = f"/api/multi/user/{USERNAME}/m/praw_x5g968f66a/r/redditdev"
             response = session.request("DELETE", path, data=data)
             self.assertEqual("", response)
 
-    @patch("requests.Session")
-    def test_request__read_timeout_retry(self, mock_session):
-        session_instance = mock_session.return_value
-
-        # Handle Auth
-        response_dict = {"access_token": "", "expires_in": 99, "scope": ""}
-        session_instance.request.return_value = Mock(
-            headers={}, json=lambda: response_dict, status_code=200
-        )
-        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
-        authorizer = readonly_authorizer(requestor=requestor)
-        session_instance.request.reset_mock()
-
-        # Fail on subsequent request
-        exception = ReadTimeout()
-        session_instance.request.side_effect = exception
-
-        expected = (
-            "prawcore",
-            "WARNING",
-            "Retrying due to ReadTimeout() status: GET "
-            "https://oauth.reddit.com/",
-        )
-
-        with LogCapture(level=logging.WARNING) as log_capture:
-            with self.assertRaises(RequestException) as context_manager:
-                prawcore.Session(authorizer).request("GET", "/")
-            log_capture.check(expected, expected)
-        self.assertIsInstance(context_manager.exception, RequestException)
-        self.assertIs(exception, context_manager.exception.original_exception)
-        self.assertEqual(3, session_instance.request.call_count)
+    def test_request__read_timeout_retry(self):
+        self._assert_retry(ReadTimeout(), _TIMEOUT_EXPECTED)
 
     def test_request__redirect(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__redirect"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.Redirect) as context_manager:
                 session.request("GET", "/r/random")
             self.assertTrue(context_manager.exception.path.startswith("/r/"))
 
     def test_request__redirect_301(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__redirect_301"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.Redirect) as context_manager:
                 session.request("GET", "t/bird")
             self.assertTrue(context_manager.exception.path == "/r/t:bird/")
@@ -416,7 +425,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__service_unavailable"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             with self.assertRaises(prawcore.ServerError) as context_manager:
                 session.request("GET", "/")
                 session.request("GET", "/")
@@ -429,37 +438,30 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__too_large", match_requests_on=["uri", "method"]
         ):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             data = {"upload_type": "header"}
-            with open("tests/files/too_large.jpg", "rb") as fp:
-                files = {"file": fp}
-                with self.assertRaises(prawcore.TooLarge) as context_manager:
-                    session.request(
-                        "POST",
-                        "/r/reddit_api_test/api/upload_sr_img",
-                        data=data,
-                        files=files,
-                    )
+            files = {"file": upload_file("too_large.jpg")}
+            with self.assertRaises(prawcore.TooLarge) as context_manager:
+                session.request(
+                    "POST",
+                    "/r/reddit_api_test/api/upload_sr_img",
+                    data=data,
+                    files=files,
+                )
             self.assertEqual(
                 413, context_manager.exception.response.status_code
             )
 
     def test_request__too__many_requests__with_retry_headers(self):
-        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
-
-        with Betamax(requestor).use_cassette(
+        with Betamax(REQUESTOR).use_cassette(
             "Session_request__too__many_requests__with_retry_headers"
         ):
-            session = prawcore.Session(
-                readonly_authorizer(requestor=requestor)
-            )
-            session._requestor._http.headers.update(
-                {"User-Agent": "python-requests/2.25.1"}
-            )
-            with self.assertRaises(
-                prawcore.TooManyRequests
-            ) as context_manager:
-                session.request("GET", "/api/v1/me")
+            session = prawcore.Session(self.authorizer("readonly"))
+            with user_agent(REQUESTOR, "python-requests/2.25.1"):
+                with self.assertRaises(
+                    prawcore.TooManyRequests
+                ) as context_manager:
+                    session.request("GET", "/api/v1/me")
             self.assertEqual(
                 429, context_manager.exception.response.status_code
             )
@@ -481,15 +483,14 @@ class SessionTest(unittest.TestCase):
             )
 
     def test_request__too__many_requests__without_retry_headers(self):
-        requestor = prawcore.Requestor("python-requests/2.25.1")
-
-        with Betamax(requestor).use_cassette(
+        agent = f"python-requests/2.25.1 prawcore/{prawcore.__version__}"
+        with Betamax(REQUESTOR).use_cassette(
             "Session_request__too__many_requests__without_retry_headers"
-        ):
+        ), user_agent(REQUESTOR, agent):
             with self.assertRaises(
                 prawcore.exceptions.ResponseException
             ) as context_manager:
-                prawcore.Session(readonly_authorizer(requestor=requestor))
+                prawcore.Session(readonly_authorizer())
             self.assertEqual(
                 429, context_manager.exception.response.status_code
             )
@@ -508,7 +509,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__unavailable_for_legal_reasons"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             exception_class = prawcore.UnavailableForLegalReasons
             with self.assertRaises(exception_class) as context_manager:
                 session.request("GET", "/")
@@ -520,7 +521,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__unsupported_media_type"
         ):
-            session = prawcore.Session(script_authorizer())
+            session = prawcore.Session(self.authorizer("script"))
             exception_class = prawcore.SpecialError
             data = {
                 "content": "type: submission\naction: upvote",
@@ -534,10 +535,9 @@ class SessionTest(unittest.TestCase):
 
     def test_request__uri_too_long(self):
         with Betamax(REQUESTOR).use_cassette("Session_request__uri_too_long"):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             path_start = "/api/morechildren?link_id=t3_n7r3uz&children="
-            with open("tests/files/comment_ids.txt") as fp:
-                ids = fp.read()
+            ids = file_contents("comment_ids.txt").decode("utf-8")
             with self.assertRaises(prawcore.URITooLong) as context_manager:
                 session.request("GET", (path_start + ids)[:9996])
             self.assertEqual(
@@ -548,7 +548,7 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__with_insufficient_scope"
         ):
-            session = prawcore.Session(client_authorizer())
+            session = prawcore.Session(self.authorizer("client"))
             self.assertRaises(
                 prawcore.InsufficientScope,
                 session.request,
@@ -573,11 +573,38 @@ class SessionTest(unittest.TestCase):
         with Betamax(REQUESTOR).use_cassette(
             "Session_request__with_invalid_access_token__retry"
         ):
-            session = prawcore.Session(readonly_authorizer())
+            session = prawcore.Session(self.authorizer("readonly"))
             session._authorizer.access_token += "invalid"
             response = session.request("GET", "/")
         self.assertIsInstance(response, dict)
 
+    def test_request__with_invalid_access_token__evicts_cached_token(self):
+        def token_response(access_token):
+            payload = {"access_token": access_token, "expires_in": 3600}
+            payload["scope"] = "*"
+            return Mock(headers={}, json=lambda: payload, status_code=200)
+
+        with patch.object(REQUESTOR._http, "request") as mock_request:
+            mock_request.side_effect = [
+                token_response("revoked"),
+                Mock(headers={}, status_code=401),
+                token_response("fresh"),
+                Mock(headers={}, json=lambda: {}, status_code=200),
+            ]
+            authenticator = prawcore.TrustedAuthenticator(
+                REQUESTOR, CLIENT_ID, CLIENT_SECRET
+            )
+            session = prawcore.Session(
+                prawcore.ReadOnlyAuthorizer(authenticator)
+            )
+            self.assertEqual({}, session.request("GET", "/"))
+
+        self.assertEqual(4, mock_request.call_count)
+        self.assertEqual(
+            {"Authorization": "bearer fresh"},
+            mock_request.call_args.kwargs["headers"],
+        )
+
     def test_request__with_invalid_authorizer(self):
         session = prawcore.Session(InvalidAuthorizer())
         self.assertRaises(